@@ -19,16 +19,306 @@ import sys
 import os
 import argparse
 import shutil
-import math
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
-from urllib.parse import urlparse
-import hashlib
-import uuid
+from typing import Dict, Any, List, Optional, Set, Union
 from datetime import datetime, timezone
 import logging
 
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s:%(lineno)d - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger(__name__)
+
+# orjson parses and serializes the large scraped JSON files 3-5x faster than
+# the stdlib encoder; fall back to stdlib json when it is not installed.
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=_json_default)
+
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize the slotted record types used during layer conversion."""
+    if isinstance(obj, Transform):
+        return obj.as_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class Transform:
+    """
+    Per-layer transform kept as a slotted record during conversion.
+
+    Slots give fixed-offset attribute storage instead of a per-layer
+    hashmap, which matters when converting banners with hundreds of
+    layers; instances are expanded to plain dicts at JSON dump time.
+    Declared with a manual __slots__ tuple rather than
+    dataclass(slots=True), which requires Python 3.10 while this
+    project supports 3.8+.
+    """
+
+    __slots__ = ('x', 'y', 'width', 'height', 'rotation',
+                 'scaleX', 'scaleY', 'opacity')
+
+    def __init__(self, x: float, y: float, width: float, height: float,
+                 rotation: float, scaleX: float = 1.0, scaleY: float = 1.0,
+                 opacity: float = 1.0):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.rotation = rotation
+        self.scaleX = scaleX
+        self.scaleY = scaleY
+        self.opacity = opacity
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            'x': self.x,
+            'y': self.y,
+            'width': self.width,
+            'height': self.height,
+            'rotation': self.rotation,
+            'scaleX': self.scaleX,
+            'scaleY': self.scaleY,
+            'opacity': self.opacity,
+        }
+
+# NumPy is optional: when present, rotation extraction over large layer
+# batches is vectorized instead of computed matrix-by-matrix.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional compiled accelerator for the per-layer conversion loop. The
+# extension is not shipped with the source tree; when a built
+# _layer_convert module is importable it is dispatched to at runtime,
+# otherwise the pure-Python conversion below is used.
+try:
+    from _layer_convert import convert_layer as _convert_layer_native
+except ImportError:
+    _convert_layer_native = None
+
+
+# Precompiled patterns for the per-layer hot paths
+_URL_RE = re.compile(r'url\(["\']?([^"\']+)["\']?\)')
+_MATRIX_RE = re.compile(r'matrix\(([^)]+)\)')
+_BG_HAS_ASSET_RE = re.compile(r'url\(|\.(?:jpg|png|gif)', re.IGNORECASE)
+
+
+# Below this many layers the NumPy call overhead outweighs the vectorization
+_BATCH_ROTATION_MIN_LAYERS = 64
+
+
+# Default property templates shared across layer conversions. Copying a
+# pre-built dict is cheaper than rebuilding the literal per layer and keeps
+# the key strings interned once; mutable nested values (shadow, fill, ...)
+# are still constructed per call.
+_TEXT_PROPERTY_DEFAULTS = {
+    'text': 'Text',
+    'fontFamily': 'Arial',
+    'fontSize': 16.0,
+    'fontWeight': 'normal',
+    'fontStyle': 'normal',
+    'textAlign': 'left',
+    'color': '#000000',
+    'lineHeight': 1.2,
+    'letterSpacing': 0.0,
+    'textDecoration': 'none',
+}
+_TEXT_FLOAT_KEYS = ('fontSize', 'lineHeight', 'letterSpacing')
+
+_IMAGE_PROPERTY_DEFAULTS = {
+    'alt': '',
+    'fit': 'contain',
+}
+
+_SHAPE_PROPERTY_DEFAULTS = {
+    'shapeType': 'rectangle',
+    'stroke': 'transparent',
+    'strokeWidth': 0.0,
+    'strokeOpacity': 1.0,
+    'cornerRadius': 0.0,
+    'sides': 4,
+    'points': 5,
+    'innerRadius': 0.5,
+    'x1': 0.0,
+    'y1': 0.0,
+    'x2': 100.0,
+    'y2': 100.0,
+}
+_SHAPE_FLOAT_KEYS = ('strokeWidth', 'strokeOpacity', 'cornerRadius',
+                     'innerRadius', 'x1', 'y1', 'x2', 'y2')
+_SHAPE_INT_KEYS = ('sides', 'points')
+
+_SVG_PROPERTY_DEFAULTS = {
+    'svgContent': '',
+    'preserveAspectRatio': 'xMidYMid meet',
+    'fill': '',
+    'stroke': '',
+    'strokeWidth': 1.0,
+}
+
+# Intern the shared default strings once; every layer that keeps a default
+# then references a single object, which trivializes hashing and equality
+# in the JSON encoder downstream
+for _template in (_TEXT_PROPERTY_DEFAULTS, _IMAGE_PROPERTY_DEFAULTS,
+                  _SHAPE_PROPERTY_DEFAULTS, _SVG_PROPERTY_DEFAULTS):
+    for _key, _value in _template.items():
+        if type(_value) is str:
+            _template[_key] = sys.intern(_value)
+del _template, _key, _value
+
+# Semantic role tokens to layer types; insertion order preserves the
+# original precedence for the substring fallback
+_ROLE_TYPE_MAP = {
+    'image': 'image',
+    'picture': 'image',
+    'text': 'text',
+    'heading': 'text',
+    'paragraph': 'text',
+    'button': 'button',
+    'link': 'button',
+    'shape': 'shape',
+    'rect': 'shape',
+    'circle': 'shape',
+}
+
+
+def _batch_extract_rotations(transforms: List[Optional[str]]) -> Optional[List[float]]:
+    """
+    Extract rotation angles for a batch of CSS transform strings at once.
+
+    Gathers all matrix components in one pass and computes the angles with
+    a single vectorized arctan2 call. Returns None when NumPy is missing or
+    the batch is too small to benefit, in which case callers fall back to
+    the per-layer path.
+    """
+    if np is None or len(transforms) < _BATCH_ROTATION_MIN_LAYERS:
+        return None
+
+    rotations = [0.0] * len(transforms)
+    indices = []
+    components = []
+    for i, transform_str in enumerate(transforms):
+        if not transform_str or 'matrix' not in transform_str:
+            continue
+        match = _MATRIX_RE.search(transform_str)
+        if not match:
+            continue
+        try:
+            values = [float(x.strip()) for x in match.group(1).split(',')]
+        except ValueError:
+            continue
+        if len(values) >= 2:
+            indices.append(i)
+            components.append((values[1], values[0]))  # (b, a)
+
+    if indices:
+        matrix = np.asarray(components, dtype=np.float64)
+        degrees = np.degrees(np.arctan2(matrix[:, 0], matrix[:, 1]))
+        for i, rotation in zip(indices, degrees):
+            rotations[i] = float(rotation)
+
+    return rotations
+
+
+def _as_float(value: Any, default: float) -> float:
+    """Coerce to float, skipping the parse when the value is already numeric."""
+    if value is None:
+        return default
+    if type(value) is float:
+        return value
+    if type(value) is int:
+        return float(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _as_int(value: Any, default: int) -> int:
+    """Coerce to int, skipping the parse when the value is already an int."""
+    if value is None:
+        return default
+    if type(value) is int:
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _basename(path: str) -> str:
+    """Tail component of a '/'-separated path, without splitting every segment."""
+    return path.rpartition('/')[2] or path
+
+
+def _copy_file(source: Path, dest: Path) -> None:
+    """
+    Copy file data using the kernel fast path when available.
+
+    os.copy_file_range keeps the data in kernel space (and is a pure
+    metadata operation on reflink-capable filesystems); fall back to
+    shutil.copyfile where it is unsupported.
+    """
+    try:
+        with open(source, 'rb') as fsrc, open(dest, 'wb') as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except (AttributeError, OSError):
+        shutil.copyfile(source, dest)
+
+
+def _transfer_file(source: Path, dest: Path, mode: str = 'copy') -> None:
+    """
+    Place source at dest using the configured transfer mode.
+
+    'hardlink' and 'symlink' avoid duplicating asset bytes entirely when
+    the export lives on the same filesystem as the scrape; both fall back
+    to a real copy when linking is not possible.
+    """
+    try:
+        if os.path.samefile(source, dest):
+            return
+    except OSError:
+        pass
+
+    if mode == 'hardlink':
+        try:
+            os.link(source, dest)
+            return
+        except OSError:
+            pass  # cross-device link or unsupported filesystem
+    elif mode == 'symlink':
+        try:
+            os.symlink(os.path.abspath(source), dest)
+            return
+        except OSError:
+            pass
+
+    _copy_file(source, dest)
+
+
 class DesignExporter:
     """
     Exports scraped banner data to various formats including the frontend Design object format.
@@ -46,24 +336,26 @@ class DesignExporter:
         └── ...
     """
     
-    def __init__(self, global_assets: bool = False):
+    def __init__(self, global_assets: bool = False, copy_mode: str = 'copy') -> None:
         """
         Initialize the exporter.
-        
+
         Args:
             global_assets: Whether assets are stored globally or per-project
+            copy_mode: How to materialize assets in the export: 'copy',
+                       'hardlink' or 'symlink'
         """
         self.global_assets = global_assets
-        self.logger = self._setup_logging()
-        
-    def _setup_logging(self):
-        """Setup logging configuration."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s:%(lineno)d - %(levelname)s - %(message)s',
-            handlers=[logging.StreamHandler(sys.stdout)]
-        )
-        return logging.getLogger(__name__)
+        self.copy_mode = copy_mode
+        self.logger = logger
+        # Reverse asset indexes, rebuilt per export (see export_to_design_object)
+        self._assets_by_url: Dict[str, str] = {}
+        self._assets_by_basename: Dict[str, str] = {}
+        self._assets_present: Set[str] = set()
+        # Asset path resolution depends only on the asset mode, so the
+        # prefix is fixed for the instance lifetime
+        self._asset_prefix = '../global_assets/' if global_assets else 'assets/'
+        self._asset_path_cache: Dict[str, str] = {}
     
     def export_banner(self, 
                      banner_dir: Path, 
@@ -131,19 +423,45 @@ class DesignExporter:
             raise FileNotFoundError(f"No valid banner sizes found in {banner_dir}")
         
         self.logger.info(f"📐 Found {len(available_sizes)} sizes: {', '.join(available_sizes)}")
-        
+
         exported_designs = {}
-        for size in available_sizes:
+        if len(available_sizes) == 1:
+            # A process pool is pure overhead for a single size
+            size = available_sizes[0]
             try:
-                size_output_dir = output_dir / size
-                scraped_dir = banner_dir / size
-                design_object = self.export_to_design_object(scraped_dir, size_output_dir, options)
+                design_object = self.export_to_design_object(
+                    banner_dir / size, output_dir / size, options
+                )
                 exported_designs[size] = design_object
                 self.logger.info(f"✅ Exported {size}")
             except Exception as e:
                 self.logger.error(f"❌ Failed to export {size}: {e}")
-                continue
-        
+        else:
+            # Sizes are fully independent (separate JSON parse, asset copy and
+            # dump), so fan them out across cores
+            max_workers = min(len(available_sizes), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        _export_single_size, str(banner_dir), size,
+                        str(output_dir), options, self.global_assets,
+                        self.copy_mode
+                    ): size
+                    for size in available_sizes
+                }
+                for future in as_completed(futures):
+                    size = futures[future]
+                    try:
+                        exported_designs[size] = future.result()
+                        self.logger.info(f"✅ Exported {size}")
+                    except Exception as e:
+                        self.logger.error(f"❌ Failed to export {size}: {e}")
+            # as_completed yields in finish order; restore size order
+            exported_designs = {
+                size: exported_designs[size]
+                for size in available_sizes if size in exported_designs
+            }
+
         return exported_designs
     
     def _discover_banner_sizes(self, banner_dir: Path) -> List[str]:
@@ -157,14 +475,19 @@ class DesignExporter:
             List of available sizes (e.g., ["300x600", "728x90"])
         """
         sizes = []
-        
-        if not banner_dir.is_dir():
+
+        # os.scandir reuses the dirent type information from the directory
+        # listing, so each candidate costs no extra stat call
+        try:
+            entries = os.scandir(banner_dir)
+        except OSError:
             return sizes
-        
-        for item in banner_dir.iterdir():
-            if item.is_dir() and self._is_valid_size_directory(item):
-                sizes.append(item.name)
-        
+
+        with entries:
+            for entry in entries:
+                if entry.is_dir() and self._is_valid_size_directory(Path(entry.path)):
+                    sizes.append(entry.name)
+
         # Sort sizes for consistent ordering
         sizes.sort()
         return sizes
@@ -182,14 +505,13 @@ class DesignExporter:
         # Check if directory name looks like a size (contains 'x' and digits)
         if 'x' not in size_dir.name.lower():
             return False
-        
-        # Check if it contains required files
-        required_files = ['metadata.json']
-        for required_file in required_files:
-            if not (size_dir / required_file).exists():
-                return False
-        
-        return True
+
+        # One stat call answers both "exists" and "non-empty" for the
+        # required metadata file
+        try:
+            return os.stat(size_dir / 'metadata.json').st_size > 0
+        except OSError:
+            return False
     
     def export_to_design_object(self, 
                                scraped_dir: Path, 
@@ -215,7 +537,22 @@ class DesignExporter:
         metadata = self._load_metadata(scraped_dir)
         design_data = self._load_design_data(scraped_dir)
         assets_mapping = self._load_assets_mapping(scraped_dir)
-        
+
+        # Snapshot the assets directory once; per-layer URL resolution then
+        # checks set membership instead of stat-ing candidate files
+        assets_dir = scraped_dir / 'assets'
+        self._assets_present = set(os.listdir(assets_dir)) if assets_dir.is_dir() else set()
+
+        # Invert the mapping once so per-layer asset lookups are hash
+        # probes instead of a substring scan over every asset
+        self._assets_by_url = {}
+        self._assets_by_basename = {}
+        for asset_file, asset_path in assets_mapping.items():
+            if isinstance(asset_path, str):
+                self._assets_by_url[asset_path] = asset_file
+                self._assets_by_basename.setdefault(_basename(asset_path), asset_file)
+            self._assets_by_basename.setdefault(asset_file, asset_file)
+
         # Convert to Design object format
         design_object = self._convert_to_design_object(
             metadata, design_data, assets_mapping, scraped_dir, options or {}
@@ -227,22 +564,27 @@ class DesignExporter:
         
         # Copy assets to output directory
         if not self.global_assets:
-            self._copy_assets(scraped_dir, output_dir, assets_mapping)
+            self._copy_assets(scraped_dir, output_dir, assets_mapping, design_data)
         
-        with open(design_file, 'w', encoding='utf-8') as f:
-            json.dump(design_object, f, indent=2, ensure_ascii=False)
+        # Write to a temp file and swap it in, so a crash mid-write never
+        # leaves a truncated design.json behind
+        tmp_file = design_file.with_suffix('.json.tmp')
+        tmp_file.write_bytes(_json_dumps(design_object))
+        os.replace(tmp_file, design_file)
         
         self.logger.info(f"✅ Design object exported to {design_file}")
         return design_object
     
-    def _copy_assets(self, scraped_dir: Path, output_dir: Path, assets_mapping: Dict[str, Any]) -> None:
+    def _copy_assets(self, scraped_dir: Path, output_dir: Path, assets_mapping: Dict[str, Any],
+                     design_data: Optional[Dict[str, Any]] = None) -> None:
         """
         Copy only the assets that are actually referenced by layers.
-        
+
         Args:
             scraped_dir: Source directory containing assets
             output_dir: Destination directory
             assets_mapping: Asset URL mappings
+            design_data: Already-parsed design data, to avoid reloading it from disk
         """
         self.logger.info(f"📁 Copying referenced assets from {scraped_dir}")
         
@@ -260,7 +602,7 @@ class DesignExporter:
         assets_output_dir.mkdir(parents=True, exist_ok=True)
         
         # First, collect all asset references from the design data
-        referenced_assets = self._collect_referenced_assets(scraped_dir)
+        referenced_assets = self._collect_referenced_assets(scraped_dir, design_data)
         
         if not referenced_assets:
             self.logger.info("No assets referenced by layers, skipping asset copying")
@@ -281,43 +623,48 @@ class DesignExporter:
                 self.logger.warning(f"No assets directory found in {scraped_dir}")
                 return
         
-        # Copy only the referenced assets
-        copied_count = 0
-        
-        for asset_reference in referenced_assets:
-            try:
-                # Extract filename from the asset reference
-                if '../global_assets/' in asset_reference:
-                    filename = asset_reference.split('/')[-1]
-                elif 'assets/' in asset_reference:
-                    filename = asset_reference.split('/')[-1]
-                else:
-                    filename = asset_reference.split('/')[-1] if '/' in asset_reference else asset_reference
-                
-                # Find the source file
-                source_file = scraped_assets_dir / filename
-                
-                if not source_file.exists():
-                    self.logger.warning(f"Referenced asset file not found: {filename}")
-                    continue
-                
-                # Copy to destination
-                dest_file = assets_output_dir / filename
-                if not dest_file.exists():  # Don't overwrite existing files
-                    shutil.copy2(source_file, dest_file)
-                    copied_count += 1
-                    self.logger.debug(f"✅ Copied referenced asset: {filename}")
-                
-            except Exception as e:
-                self.logger.error(f"Failed to copy referenced asset {asset_reference}: {e}")
+        # Enumerate the destination directory once instead of stat-ing every
+        # candidate dest file in the loop below
+        existing = {entry.name for entry in os.scandir(assets_output_dir)}
+
+        # Resolve (source, dest) pairs first, then fan the copies out to a
+        # thread pool — the GIL is released inside the kernel copy; the
+        # references are already keyed by filename, so no splitting or
+        # deduplication is needed here
+        copy_pairs = []
+        for filename in referenced_assets:
+            # Find the source file
+            source_file = scraped_assets_dir / filename
+
+            if not source_file.exists():
+                self.logger.warning(f"Referenced asset file not found: {filename}")
                 continue
-        
+
+            # Copy to destination unless it already exists
+            if filename not in existing:
+                copy_pairs.append((source_file, assets_output_dir / filename))
+
+        copied_count = 0
+        if copy_pairs:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {
+                    executor.submit(_transfer_file, src, dst, self.copy_mode): src
+                    for src, dst in copy_pairs
+                }
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                        copied_count += 1
+                        self.logger.debug(f"✅ Copied referenced asset: {futures[future].name}")
+                    except Exception as e:
+                        self.logger.error(f"Failed to copy referenced asset {futures[future].name}: {e}")
+
         # Copy screenshot if it exists
         screenshot_file = scraped_dir / 'screenshot.png'
         if screenshot_file.exists():
             dest_screenshot = output_dir / 'screenshot.png'
             try:
-                shutil.copy2(screenshot_file, dest_screenshot)
+                _transfer_file(screenshot_file, dest_screenshot, self.copy_mode)
                 copied_count += 1
                 self.logger.debug("✅ Copied screenshot.png")
             except Exception as e:
@@ -325,28 +672,33 @@ class DesignExporter:
         
         self.logger.info(f"📁 Copied {copied_count} referenced assets to {assets_output_dir}")
         
-        # List what was copied for debugging
-        if assets_output_dir.exists():
+        # List what was copied for debugging; the directory listing and the
+        # joined string are only worth building when DEBUG is actually on
+        if logger.isEnabledFor(logging.DEBUG) and assets_output_dir.exists():
             copied_files = [f.name for f in assets_output_dir.iterdir() if f.is_file()]
             self.logger.debug(f"Copied assets: {', '.join(copied_files[:10])}")
             if len(copied_files) > 10:
                 self.logger.debug(f"... and {len(copied_files) - 10} more files")
     
-    def _collect_referenced_assets(self, scraped_dir: Path) -> set:
+    def _collect_referenced_assets(self, scraped_dir: Path,
+                                   design_data: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
         """
         Collect all asset references from the design layers.
-        
+
         Args:
             scraped_dir: Source directory containing design data
-            
+            design_data: Already-parsed design data; loaded from disk when None
+
         Returns:
-            Set of asset paths referenced by layers
+            Dict mapping asset filename to the original reference path,
+            deduplicated at collection time
         """
-        referenced_assets = set()
-        
+        referenced_assets: Dict[str, str] = {}
+
         try:
-            # Load design data to analyze layer assets
-            design_data = self._load_design_data(scraped_dir)
+            # Load design data to analyze layer assets (unless the caller already did)
+            if design_data is None:
+                design_data = self._load_design_data(scraped_dir)
             layers = design_data.get('layers', [])
             
             for layer in layers:
@@ -356,19 +708,18 @@ class DesignExporter:
                 # Check for image assets
                 if layer_type == 'image' and content.get('src'):
                     src_path = content['src']
-                    referenced_assets.add(src_path)
+                    referenced_assets[_basename(src_path)] = src_path
                     self.logger.debug(f"Found image asset reference: {src_path}")
                 
                 # Check for background images in styles
                 styles = layer.get('styles', {})
                 background = styles.get('background', '')
-                if background and ('url(' in background or '.jpg' in background or '.png' in background or '.gif' in background):
+                if background and _BG_HAS_ASSET_RE.search(background):
                     # Extract URL from background property
-                    import re
-                    url_match = re.search(r'url\(["\']?([^"\']+)["\']?\)', background)
+                    url_match = _URL_RE.search(background)
                     if url_match:
                         bg_url = url_match.group(1)
-                        referenced_assets.add(bg_url)
+                        referenced_assets[_basename(bg_url)] = bg_url
                         self.logger.debug(f"Found background asset reference: {bg_url}")
             
             self.logger.info(f"Collected {len(referenced_assets)} asset references from layers")
@@ -383,24 +734,21 @@ class DesignExporter:
         metadata_file = scraped_dir / 'metadata.json'
         if not metadata_file.exists():
             raise FileNotFoundError(f"Metadata file not found: {metadata_file}")
-        
-        with open(metadata_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    
+
+        return _json_loads(metadata_file.read_bytes())
+
     def _load_design_data(self, scraped_dir: Path) -> Dict[str, Any]:
         """Load design data from scraped banner directory."""
         design_file = scraped_dir / 'design_data.json'
         if design_file.exists():
-            with open(design_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _json_loads(design_file.read_bytes())
         return {}
-    
+
     def _load_assets_mapping(self, scraped_dir: Path) -> Dict[str, Any]:
         """Load assets mapping from scraped banner directory."""
         assets_file = scraped_dir / 'assets.json'
         if assets_file.exists():
-            with open(assets_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _json_loads(assets_file.read_bytes())
         return {}
     
     def _convert_to_design_object(self, 
@@ -422,6 +770,8 @@ class DesignExporter:
         Returns:
             Design object compatible with frontend
         """
+        import uuid
+
         self.logger.info("🔄 Converting scraped data to Design object format")
         
         # Generate unique design ID
@@ -443,6 +793,9 @@ class DesignExporter:
             banner_width = metadata.get('canvas', {}).get('width', 800)
             banner_height = metadata.get('canvas', {}).get('height', 600)
         
+        # Single timestamp shared by createdAt/updatedAt
+        now_iso = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+
         # Create base Design object structure
         design_object = {
             "id": design_id,
@@ -454,8 +807,8 @@ class DesignExporter:
             "userId": options.get('user_id', 'scraper'),
             "projectId": options.get('project_id'),
             "isPublic": options.get('is_public', False),
-            "createdAt": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
-            "updatedAt": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+            "createdAt": now_iso,
+            "updatedAt": now_iso,
             "syncStatus": "synced",
             "isTemporary": False,
             "data": self._create_design_data(metadata, design_data, options),
@@ -533,71 +886,88 @@ class DesignExporter:
         Returns:
             List of Layer objects
         """
-        layers = []
-        
         # Get the main layers array from the scraped data
         scraped_layers = design_data.get('layers', [])
         
         self.logger.info(f"🔄 Converting {len(scraped_layers)} layers from scraped data")
-        
+
+        # Vectorized rotation pre-pass for large banners (None on small
+        # batches or when NumPy is unavailable)
+        rotations = _batch_extract_rotations([
+            (layer_data.get('styles') or {}).get('transform')
+            for layer_data in scraped_layers
+        ])
+
+        # Preallocate the result list and write by index; skipped slots are
+        # compacted once at the end instead of growing the list per layer
+        layers: List[Optional[Dict[str, Any]]] = [None] * len(scraped_layers)
         for layer_index, layer_data in enumerate(scraped_layers):
             try:
-                layer = self._convert_scraped_layer(layer_data, assets_mapping, scraped_dir, layer_index)
-                if layer:
-                    layers.append(layer)
+                if _convert_layer_native is not None:
+                    layers[layer_index] = _convert_layer_native(layer_data, assets_mapping, layer_index)
+                else:
+                    layers[layer_index] = self._convert_scraped_layer(
+                        layer_data, assets_mapping, scraped_dir, layer_index,
+                        rotation=rotations[layer_index] if rotations else None
+                    )
             except Exception as e:
                 self.logger.warning(f"Failed to convert layer {layer_data.get('id', 'unknown')}: {e}")
                 continue
+
+        layers = [layer for layer in layers if layer]
         
-        # Sort layers by zIndex for proper ordering
-        layers.sort(key=lambda x: x.get('transform', {}).get('zIndex', 0))
+        # Sort layers by zIndex for proper ordering; every converted layer
+        # carries a top-level zIndex, so no nested lookups are needed
+        layers.sort(key=lambda layer: layer['zIndex'])
         
         self.logger.info(f"✅ Successfully converted {len(layers)} layers")
         return layers
     
-    def _convert_scraped_layer(self, 
-                              layer_data: Dict[str, Any], 
+    def _convert_scraped_layer(self,
+                              layer_data: Dict[str, Any],
                               assets_mapping: Dict[str, Any],
                               scraped_dir: Path,
-                              layer_index: int) -> Dict[str, Any]:
+                              layer_index: int,
+                              rotation: Optional[float] = None) -> Dict[str, Any]:
         """
         Convert a scraped layer to frontend Layer object.
-        
+
         Args:
             layer_data: Raw layer data from scraping
             assets_mapping: Asset URL to local path mappings
             scraped_dir: Source directory for resolving asset paths
             layer_index: Layer index for ordering
-            
+            rotation: Precomputed rotation from the batched pre-pass, or None
+                to extract it from the layer's transform here
+
         Returns:
             Layer object
         """
-        position = layer_data.get('position', {})
-        styles = layer_data.get('styles', {})
-        content = layer_data.get('content', {})
-        
+        # Bind dict lookups once; these run 10+ times per layer on large banners
+        pos_get = layer_data.get('position', {}).get
+        sty_get = layer_data.get('styles', {}).get
+
         # Determine layer type from scraped data
         layer_type = layer_data.get('type', 'text')
-        
+
         # Generate transform with proper zIndex handling
-        transform = {
-            'x': float(position.get('x', 0)),
-            'y': float(position.get('y', 0)),
-            'width': float(position.get('width', 100)),
-            'height': float(position.get('height', 100)),
-            'rotation': self._extract_rotation_from_transform(styles.get('transform')),
-            'scaleX': 1.0,
-            'scaleY': 1.0,
-            'opacity': float(styles.get('opacity', 1))
-        }
-        
+        transform = Transform(
+            x=float(pos_get('x', 0)),
+            y=float(pos_get('y', 0)),
+            width=float(pos_get('width', 100)),
+            height=float(pos_get('height', 100)),
+            rotation=rotation if rotation is not None
+                     else self._extract_rotation_from_transform(sty_get('transform')),
+            opacity=float(sty_get('opacity', 1))
+        )
+
         layer = {
             'id': layer_data.get('id', f'layer_{layer_index}'),
             'type': layer_type,
             'name': layer_data.get('semanticRole', f'{layer_type.title()} {layer_index + 1}'),
             'visible': True,
             'locked': False,
-            'zIndex': position.get('zIndex', layer_index),
+            'zIndex': pos_get('zIndex', layer_index),
             'syncStatus': 'synced',
             'isTemporary': False,
             'transform': transform,
@@ -618,11 +988,12 @@ class DesignExporter:
         """
         if not transform_str or 'matrix' not in transform_str:
             return 0.0
-        
+
+        import math
+
         try:
             # Extract matrix values from transform string
-            import re
-            match = re.search(r'matrix\(([^)]+)\)', transform_str)
+            match = _MATRIX_RE.search(transform_str)
             if match:
                 values = [float(x.strip()) for x in match.group(1).split(',')]
                 if len(values) >= 2:
@@ -652,37 +1023,39 @@ class DesignExporter:
             Layer properties dict
         """
         layer_type = layer_data.get('type', 'text')
-        content = layer_data.get('content', {})
-        styles = layer_data.get('styles', {})
-        
+        # Bind the dict/method lookups once; this runs for every layer and
+        # reads up to ~15 fields per call
+        cget = layer_data.get('content', {}).get
+        sget = layer_data.get('styles', {}).get
+
         properties = {}
-        
+
         if layer_type == 'image':
             # Handle image layer properties
-            src_path = content.get('src', '')
-            
+            src_path = cget('src', '')
+
             # Resolve the asset path for export
             resolved_src = self._resolve_image_asset_for_export(src_path, assets_mapping, scraped_dir)
-            
+
             properties.update({
                 'src': resolved_src,
-                'alt': content.get('alt', ''),
+                'alt': cget('alt', ''),
                 'objectFit': 'contain',  # Default fit for scraped images
                 'filters': {},
                 'border': {},
                 'shadow': {}
             })
-        
+
         elif layer_type == 'text':
             # Handle text layer properties
             properties.update({
-                'text': content.get('text', ''),
-                'fontFamily': self._clean_font_family(styles.get('fontFamily', 'Arial')),
-                'fontSize': self._parse_font_size(styles.get('fontSize', '16px')),
-                'fontWeight': styles.get('fontWeight', 'normal'),
-                'fontStyle': styles.get('fontStyle', 'normal'),
-                'color': styles.get('color', '#000000'),
-                'textAlign': styles.get('textAlign', 'left'),
+                'text': cget('text', ''),
+                'fontFamily': self._clean_font_family(sget('fontFamily', 'Arial')),
+                'fontSize': self._parse_font_size(sget('fontSize', '16px')),
+                'fontWeight': sget('fontWeight', 'normal'),
+                'fontStyle': sget('fontStyle', 'normal'),
+                'color': sget('color', '#000000'),
+                'textAlign': sget('textAlign', 'left'),
                 'textDecoration': 'none',
                 'lineHeight': 1.2,
                 'letterSpacing': 0,
@@ -719,7 +1092,7 @@ class DesignExporter:
         
         # If it's already a global asset path, extract the filename
         if '../global_assets/' in src_path:
-            filename = src_path.split('/')[-1]
+            filename = _basename(src_path)
             
             # For global assets mode, keep the global path
             if self.global_assets:
@@ -728,18 +1101,30 @@ class DesignExporter:
                 # For per-project mode, change to local assets path
                 return f"assets/{filename}"
         
-        # For other asset types, try to find in mapping
+        # For other asset types, probe the reverse indexes first (exact
+        # path, then basename); only unresolved references fall back to
+        # the substring scan over the mapping
+        asset_name = (self._assets_by_url.get(src_path)
+                      or self._assets_by_basename.get(_basename(src_path)))
+        if asset_name is not None:
+            asset_path = assets_mapping.get(asset_name, asset_name)
+            if not isinstance(asset_path, str):
+                asset_path = asset_name
+            if self.global_assets:
+                return asset_path  # Keep global path
+            return f"assets/{_basename(asset_path) if '/' in asset_path else asset_name}"
+
         for asset_name, asset_path in assets_mapping.items():
             if src_path in asset_path or asset_name in src_path:
-                filename = asset_path.split('/')[-1] if '/' in asset_path else asset_name
-                
+                filename = _basename(asset_path) if '/' in asset_path else asset_name
+
                 if self.global_assets:
                     return asset_path  # Keep global path
                 else:
                     return f"assets/{filename}"  # Use local assets path
         
         # Fallback: extract filename from src_path
-        filename = src_path.split('/')[-1] if '/' in src_path else src_path
+        filename = _basename(src_path)
         
         if self.global_assets:
             return f"../global_assets/{filename}"
@@ -775,16 +1160,23 @@ class DesignExporter:
         """
         if not font_size:
             return 16.0
-        
-        try:
-            # Extract numeric part
-            import re
-            match = re.search(r'([\d.]+)', str(font_size))
-            if match:
-                return float(match.group(1))
-        except (ValueError, AttributeError):
-            pass
-        
+
+        # A character scan beats the regex engine on these short strings;
+        # take the leading run of digits/dots and ignore the unit suffix
+        s = str(font_size).strip()
+        end = 0
+        for ch in s:
+            if ch.isdigit() or ch == '.':
+                end += 1
+            else:
+                break
+
+        if end:
+            try:
+                return float(s[:end])
+            except ValueError:
+                pass
+
         return 16.0
 
     def _convert_scraped_text_to_layer(self, 
@@ -800,10 +1192,20 @@ class DesignExporter:
         Returns:
             Text Layer object
         """
+        # Fast path: data that already carries frontend-shaped properties
+        # (re-exports of normalized sources) passes through unchanged except
+        # for the id/zIndex defaults
+        props = text_data.get('properties')
+        if (isinstance(props, dict) and 'text' in props and 'fontFamily' in props
+                and text_data.get('type') == 'text'):
+            text_data.setdefault('id', f'text_{layer_index}')
+            text_data.setdefault('zIndex', layer_index)
+            return text_data
+
         position = text_data.get('position', {})
         styles = text_data.get('styles', {})
         content = text_data.get('content', {})
-        
+
         layer = {
             'id': text_data.get('id', f'text_{layer_index}'),
             'type': 'text',
@@ -862,17 +1264,17 @@ class DesignExporter:
         if content.get('text'):
             return 'text'
         
-        # Check for semantic role hints
+        # Check for semantic role hints: one hash lookup handles exact role
+        # tokens; only non-exact roles pay for the substring fallback
         semantic_role = layer_data.get('semanticRole', '').lower()
-        if 'image' in semantic_role or 'picture' in semantic_role:
-            return 'image'
-        elif 'text' in semantic_role or 'heading' in semantic_role or 'paragraph' in semantic_role:
-            return 'text'
-        elif 'button' in semantic_role or 'link' in semantic_role:
-            return 'button'
-        elif 'shape' in semantic_role or 'rect' in semantic_role or 'circle' in semantic_role:
-            return 'shape'
-        
+        layer_type = _ROLE_TYPE_MAP.get(semantic_role)
+        if layer_type is not None:
+            return layer_type
+
+        for token, layer_type in _ROLE_TYPE_MAP.items():
+            if token in semantic_role:
+                return layer_type
+
         # Default to shape for unknown types
         return 'shape'
     
@@ -902,15 +1304,20 @@ class DesignExporter:
             local_filename = None
             src_url = content.get('src', '')
             
-            # Find local filename from assets mapping
-            for asset_file, asset_path in assets_mapping.items():
-                if src_url in asset_path or asset_file in src_url:
-                    local_filename = asset_file
-                    break
-            
+            # Find local filename via the reverse indexes (exact URL match,
+            # then basename match); fall back to the substring scan only for
+            # partial-path references
+            local_filename = (self._assets_by_url.get(src_url)
+                              or self._assets_by_basename.get(_basename(src_url)))
+            if not local_filename:
+                for asset_file, asset_path in assets_mapping.items():
+                    if src_url in asset_path or asset_file in src_url:
+                        local_filename = asset_file
+                        break
+
             if not local_filename:
                 # Fallback: extract filename from URL
-                local_filename = src_url.split('/')[-1] if src_url else 'placeholder.jpg'
+                local_filename = _basename(src_url) if src_url else 'placeholder.jpg'
                 
             image_src = self._resolve_asset_path(local_filename, scraped_dir)
             properties.update({
@@ -951,37 +1358,19 @@ class DesignExporter:
         })
         
         return properties
-        
-        if layer_type == 'text':
-            return self._convert_text_properties(properties)
-        elif layer_type == 'image':
-            return self._convert_image_properties(properties, assets_mapping, scraped_dir)
-        elif layer_type == 'shape':
-            return self._convert_shape_properties(properties)
-        elif layer_type == 'svg':
-            return self._convert_svg_properties(properties, assets_mapping, scraped_dir)
-        else:
-            # Return base properties for unsupported types
-            return properties
     
     def _convert_text_properties(self, properties: Dict[str, Any]) -> Dict[str, Any]:
         """Convert text layer properties to frontend format."""
-        return {
-            "text": properties.get('text', 'Text'),
-            "fontFamily": properties.get('fontFamily', 'Arial'),
-            "fontSize": float(properties.get('fontSize', 16)),
-            "fontWeight": properties.get('fontWeight', 'normal'),
-            "fontStyle": properties.get('fontStyle', 'normal'),
-            "textAlign": properties.get('textAlign', 'left'),
-            "color": properties.get('color', '#000000'),
-            "lineHeight": float(properties.get('lineHeight', 1.2)),
-            "letterSpacing": float(properties.get('letterSpacing', 0)),
-            "textDecoration": properties.get('textDecoration', 'none'),
-            "autoResize": {
-                "enabled": False,
-                "mode": "none"
-            }
+        out = {**_TEXT_PROPERTY_DEFAULTS}
+        for key in _TEXT_PROPERTY_DEFAULTS.keys() & properties.keys():
+            out[key] = properties[key]
+        for key in _TEXT_FLOAT_KEYS:
+            out[key] = _as_float(out[key], _TEXT_PROPERTY_DEFAULTS[key])
+        out['autoResize'] = {
+            "enabled": False,
+            "mode": "none"
         }
+        return out
     
     def _convert_image_properties(self, 
                                  properties: Dict[str, Any], 
@@ -991,42 +1380,36 @@ class DesignExporter:
         original_src = properties.get('src', '')
         resolved_src = self._resolve_asset_url(original_src, assets_mapping, scraped_dir)
         
-        return {
-            "src": resolved_src,
-            "alt": properties.get('alt', ''),
-            "fit": properties.get('fit', 'contain'),
-            "filters": properties.get('filters', []),
-            "shadow": {
-                "enabled": False,
-                "offsetX": 0,
-                "offsetY": 0,
-                "blur": 0,
-                "color": "#000000",
-                "opacity": 0.3
-            }
+        out = {**_IMAGE_PROPERTY_DEFAULTS}
+        for key in _IMAGE_PROPERTY_DEFAULTS.keys() & properties.keys():
+            out[key] = properties[key]
+        out['src'] = resolved_src
+        out['filters'] = properties.get('filters', [])
+        out['shadow'] = {
+            "enabled": False,
+            "offsetX": 0,
+            "offsetY": 0,
+            "blur": 0,
+            "color": "#000000",
+            "opacity": 0.3
         }
+        return out
     
     def _convert_shape_properties(self, properties: Dict[str, Any]) -> Dict[str, Any]:
         """Convert shape layer properties to frontend format."""
-        return {
-            "shapeType": properties.get('shapeType', 'rectangle'),
-            "fill": {
-                "type": "solid",
-                "color": properties.get('fill', '#000000'),
-                "opacity": 1
-            },
-            "stroke": properties.get('stroke', 'transparent'),
-            "strokeWidth": float(properties.get('strokeWidth', 0)),
-            "strokeOpacity": float(properties.get('strokeOpacity', 1)),
-            "cornerRadius": float(properties.get('cornerRadius', 0)),
-            "sides": int(properties.get('sides', 4)),
-            "points": int(properties.get('points', 5)),
-            "innerRadius": float(properties.get('innerRadius', 0.5)),
-            "x1": float(properties.get('x1', 0)),
-            "y1": float(properties.get('y1', 0)),
-            "x2": float(properties.get('x2', 100)),
-            "y2": float(properties.get('y2', 100))
+        out = {**_SHAPE_PROPERTY_DEFAULTS}
+        for key in _SHAPE_PROPERTY_DEFAULTS.keys() & properties.keys():
+            out[key] = properties[key]
+        for key in _SHAPE_FLOAT_KEYS:
+            out[key] = _as_float(out[key], _SHAPE_PROPERTY_DEFAULTS[key])
+        for key in _SHAPE_INT_KEYS:
+            out[key] = _as_int(out[key], _SHAPE_PROPERTY_DEFAULTS[key])
+        out['fill'] = {
+            "type": "solid",
+            "color": properties.get('fill', '#000000'),
+            "opacity": 1
         }
+        return out
     
     def _convert_svg_properties(self, 
                                properties: Dict[str, Any], 
@@ -1036,14 +1419,12 @@ class DesignExporter:
         original_src = properties.get('src', '')
         resolved_src = self._resolve_asset_url(original_src, assets_mapping, scraped_dir)
         
-        return {
-            "src": resolved_src,
-            "svgContent": properties.get('svgContent', ''),
-            "preserveAspectRatio": properties.get('preserveAspectRatio', 'xMidYMid meet'),
-            "fill": properties.get('fill', ''),
-            "stroke": properties.get('stroke', ''),
-            "strokeWidth": float(properties.get('strokeWidth', 1))
-        }
+        out = {**_SVG_PROPERTY_DEFAULTS}
+        for key in _SVG_PROPERTY_DEFAULTS.keys() & properties.keys():
+            out[key] = properties[key]
+        out['src'] = resolved_src
+        out['strokeWidth'] = _as_float(out['strokeWidth'], _SVG_PROPERTY_DEFAULTS['strokeWidth'])
+        return out
     
     def _resolve_asset_url(self, 
                           original_url: str, 
@@ -1068,14 +1449,14 @@ class DesignExporter:
             local_filename = assets_mapping[original_url]
             return self._resolve_asset_path(local_filename, scraped_dir)
         
-        # If no mapping found, try to find by filename
-        parsed_url = urlparse(original_url)
-        filename = Path(parsed_url.path).name
-        if filename:
-            assets_dir = scraped_dir / 'assets'
-            asset_file = assets_dir / filename
-            if asset_file.exists():
-                return self._resolve_asset_path(filename, scraped_dir)
+        # If no mapping found, try to find by filename; plain string ops
+        # are enough here and skip the full urlparse state machine
+        filename = _basename(original_url.split('?', 1)[0].split('#', 1)[0])
+        if '%' in filename:
+            from urllib.parse import unquote
+            filename = unquote(filename)
+        if filename and filename in self._assets_present:
+            return self._resolve_asset_path(filename, scraped_dir)
         
         # Fallback: return original URL
         self.logger.warning(f"Could not resolve asset URL: {original_url}")
@@ -1092,15 +1473,89 @@ class DesignExporter:
         Returns:
             Asset path for the exported design
         """
-        if self.global_assets:
-            # Global assets: path relative to global assets directory
-            return f"../global_assets/{local_filename}"
+        # The prefix is fixed per instance and the same filenames recur
+        # across sizes, so memoize the concatenation
+        cached = self._asset_path_cache.get(local_filename)
+        if cached is None:
+            cached = self._asset_prefix + local_filename
+            self._asset_path_cache[local_filename] = cached
+        return cached
+
+def _export_single_size(banner_dir: str, size: str, output_dir: str,
+                        options: Optional[Dict[str, Any]], global_assets: bool,
+                        copy_mode: str = 'copy') -> Dict[str, Any]:
+    """
+    Worker for export_all_sizes: export one size in its own process.
+
+    Takes plain strings so the arguments pickle cheaply; each worker
+    builds its own DesignExporter instance.
+    """
+    exporter = DesignExporter(global_assets=global_assets, copy_mode=copy_mode)
+    return exporter.export_to_design_object(
+        Path(banner_dir) / size, Path(output_dir) / size, options
+    )
+
+
+# Flags understood by the fast argv parser below; anything outside these
+# (including --help) falls back to the full argparse setup
+_CLI_VALUE_FLAGS = {'--banner-dir', '--scraped-dir', '--output-dir', '--size',
+                    '--format', '--user-id', '--project-id', '--design-id',
+                    '--copy-mode'}
+_CLI_SWITCHES = {'--all-sizes', '--global-assets', '--is-public'}
+
+
+def _parse_args_fast(argv: List[str]) -> Optional[argparse.Namespace]:
+    """
+    Minimal parser for the common batch invocation.
+
+    Batch pipelines run this script once per banner, where building the
+    full ArgumentParser dominates cold start. Returns None for anything
+    it does not recognize so the argparse path keeps handling --help,
+    errors and future flags.
+    """
+    values: Dict[str, Any] = {
+        'banner_dir': None, 'scraped_dir': None, 'output_dir': None,
+        'size': None, 'all_sizes': False, 'format': 'design',
+        'global_assets': False, 'copy_mode': 'copy', 'user_id': 'scraper',
+        'project_id': None, 'design_id': None, 'is_public': False,
+    }
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in _CLI_SWITCHES:
+            values[arg[2:].replace('-', '_')] = True
+            i += 1
+        elif arg in _CLI_VALUE_FLAGS:
+            if i + 1 >= len(argv):
+                return None
+            values[arg[2:].replace('-', '_')] = argv[i + 1]
+            i += 2
         else:
-            # Per-project assets: path relative to design directory
-            return f"assets/{local_filename}"
+            return None
+
+    # Re-check the invariants argparse would enforce; bail to argparse for
+    # proper error messages when they do not hold
+    if bool(values['banner_dir']) == bool(values['scraped_dir']):
+        return None
+    if not values['output_dir']:
+        return None
+    if values['size'] and values['all_sizes']:
+        return None
+    if values['format'] not in ('design', 'json'):
+        return None
+    if values['copy_mode'] not in ('copy', 'hardlink', 'symlink'):
+        return None
+
+    return argparse.Namespace(**values)
 
-def main():
+
+def main() -> None:
     """Command-line interface for the design exporter."""
+    args = _parse_args_fast(sys.argv[1:])
+    if args is not None:
+        _run_cli(args)
+        return
+
     parser = argparse.ArgumentParser(
         description='Export scraped HTML banner data to various formats',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1149,6 +1604,9 @@ Examples:
                        help='Export format (default: design)')
     parser.add_argument('--global-assets', action='store_true',
                        help='Use global assets mode (assets stored globally)')
+    parser.add_argument('--copy-mode', type=str, default='copy',
+                       choices=['copy', 'hardlink', 'symlink'],
+                       help='How to materialize assets in the export (default: copy)')
     parser.add_argument('--user-id', type=str, default='scraper',
                        help='User ID for the exported design')
     parser.add_argument('--project-id', type=str,
@@ -1159,10 +1617,14 @@ Examples:
                        help='Mark the design as public')
     
     args = parser.parse_args()
-    
+    _run_cli(args)
+
+
+def _run_cli(args: argparse.Namespace) -> None:
+    """Run an export from parsed CLI arguments."""
     # Create exporter
-    exporter = DesignExporter(global_assets=args.global_assets)
-    
+    exporter = DesignExporter(global_assets=args.global_assets, copy_mode=args.copy_mode)
+
     # Export options
     options = {
         'user_id': args.user_id,
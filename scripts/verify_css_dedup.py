@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Regression check for CSS handling in the content-hash dedup.
+
+Scenario: two banners (e.g. the 300x250 and 728x90 variants of the same
+design) reference byte-identical stylesheets. The first banner's stored
+CSS gets its url() references rewritten to local asset paths after
+download; the second banner must still end up with the *raw* stylesheet,
+not a hardlink to (or hash-index hit on) the already-processed copy.
+
+Runs entirely offline against a stubbed HTTP session.
+"""
+
+import asyncio
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from html_banner_scraper import HTMLBannerScraper
+
+RAW_CSS = 'body { background: url("img/bg.png"); }'
+CSS_URL_1 = 'https://cdn.example.com/styles/main.css'
+CSS_URL_2 = 'https://cdn.example.com/styles/alt.css'  # different URL, same bytes
+
+
+class _FakeContent:
+    def __init__(self, data: bytes):
+        self._data = data
+
+    async def iter_chunked(self, chunk_size: int):
+        yield self._data
+
+
+class _FakeResponse:
+    status = 200
+
+    def __init__(self, data: bytes, content_type: str):
+        self.headers = {'content-type': content_type}
+        self.content = _FakeContent(data)
+
+    def raise_for_status(self):
+        pass
+
+
+class _FakeGet:
+    def __init__(self, response: _FakeResponse):
+        self._response = response
+
+    async def __aenter__(self):
+        return self._response
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class _FakeSession:
+    """Minimal stand-in for aiohttp.ClientSession serving fixed CSS bytes."""
+
+    def get(self, url):
+        return _FakeGet(_FakeResponse(RAW_CSS.encode('utf-8'), 'text/css'))
+
+
+def _download_css(scraper, css_url, banner_dir):
+    """Download one stylesheet through the real async download path."""
+    (banner_dir / 'assets').mkdir(parents=True, exist_ok=True)
+    local_path = asyncio.run(
+        scraper._download_asset_async(_FakeSession(), css_url, '', banner_dir))
+    assert local_path, f"download failed for {css_url}"
+    return banner_dir / local_path
+
+
+def verify_css_dedup():
+    """Verify identical stylesheets across banners stay independent."""
+    print("🔍 Verifying CSS dedup behavior")
+    print("=" * 40)
+
+    work_dir = Path(tempfile.mkdtemp(prefix='css_dedup_check_'))
+    try:
+        scraper = HTMLBannerScraper(output_dir=str(work_dir / 'out'))
+
+        # Banner 1: download the stylesheet, then rewrite it in place the
+        # way _download_assets_with_retry does after a successful batch
+        banner1 = work_dir / 'banner' / '300x250'
+        css_file_1 = _download_css(scraper, CSS_URL_1, banner1)
+
+        img_url = scraper._normalize_url('img/bg.png', CSS_URL_1)
+        all_assets = {
+            CSS_URL_1: {
+                'type': 'css_file',
+                'original_url': CSS_URL_1,
+                'element_refs': [],
+                'css_refs': [],
+                'css_content': RAW_CSS
+            },
+            img_url: {
+                'type': 'css_asset',
+                'original_url': 'img/bg.png',
+                'element_refs': [],
+                'css_refs': [{
+                    'css_url': CSS_URL_1,
+                    'original_css_asset_url': 'img/bg.png'
+                }]
+            }
+        }
+        downloaded = {
+            CSS_URL_1: f"assets/{css_file_1.name}",
+            img_url: 'assets/bg.png'
+        }
+        scraper._update_html_with_unified_assets(
+            BeautifulSoup('', 'html.parser'), all_assets, downloaded, banner1)
+
+        processed = css_file_1.read_text(encoding='utf-8')
+        assert 'assets/bg.png' in processed, "banner 1 CSS was not rewritten"
+        assert css_file_1.stat().st_nlink == 1, "processed CSS shares an inode"
+        print("✅ Banner 1 stylesheet rewritten to local paths")
+
+        # Banner 2: same bytes from a different URL must arrive raw, not as
+        # a hash-index hit on banner 1's already-processed file
+        banner2 = work_dir / 'banner' / '728x90'
+        css_file_2 = _download_css(scraper, CSS_URL_2, banner2)
+
+        assert css_file_2.read_text(encoding='utf-8') == RAW_CSS, \
+            "banner 2 received processed CSS instead of the raw stylesheet"
+        assert css_file_2.stat().st_nlink == 1, "banner 2 CSS was hardlinked"
+        assert css_file_2.stat().st_ino != css_file_1.stat().st_ino, \
+            "banner CSS files share an inode"
+        print("✅ Banner 2 got its own raw copy of the shared stylesheet")
+
+        stale = [p for p in scraper._hash_index.values() if p.endswith('.css')]
+        assert not stale, f"hash index tracks rewritable CSS files: {stale}"
+        print("✅ Hash index carries no CSS entries")
+
+        print("\n🎉 CSS dedup verification passed")
+        return True
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    sys.exit(0 if verify_css_dedup() else 1)